@@ -38,6 +38,26 @@ import random
 # We use math.isclose() to safely compare floating-point sums (see rps()).
 import math
 
+# `sys` gives access to the interpreter's standard streams.
+# We write each ASCII-art image to sys.stdout in a single call.
+import sys
+
+# `io.StringIO` is an in-memory text file.  emit_many() collects several
+# ASCII-art images in one before writing them out together.
+import io
+
+# `os` gives access to environment variables.  Setting FORCE_ART=1 turns the
+# ASCII art back on when it would otherwise be skipped (see _art_enabled()).
+import os
+
+# `functools.partial` pre-fills a function's arguments.  The print_* art
+# functions are all one shared function with a different image name filled in.
+from functools import partial
+
+# `atexit` runs cleanup functions when the program ends.  We use it to make
+# sure buffered console output is written out (see _buffer_stdout()).
+import atexit
+
 
 # ---------------------------------------------------------------------------
 # CUSTOM EXCEPTION FOR GAME-ENDING EVENTS
@@ -67,12 +87,13 @@ class GameOver(Exception):
 #
 # KEY CONCEPT: A dictionary is a collection of key-value pairs.
 # Here the keys are strings ("name", "level", etc.) and the values are
-# different types — a string, integers, and lists.
+# different types — a string, integers, lists, and a set.
 
 player_info = {
     "name": "",           # Will be set by get_player_name()
     "level": 1,           # Tracks how far the player has progressed
-    "inventory": [],      # Items the player has collected
+    "inventory": [],      # Items the player has collected, in order
+    "inventory_set": set(),  # Same items, for fast "do I have it?" checks
     "location": "Starting Room",
     "health": 100,        # Hit points; reduced by damage, restored by healing
     "choices": []         # History of rooms the player has visited
@@ -90,10 +111,45 @@ def show_player_info(player_info_arg):
     """Prints the current state of the player_info dictionary."""
     print("\nPlayer Info:")
     for key, value in player_info_arg.items():
+        # inventory_set mirrors inventory, so showing it would be redundant.
+        if key == "inventory_set":
+            continue
         # .capitalize() makes the first letter uppercase: "name" -> "Name"
         print(f"  {key.capitalize()}: {value}")
 
 
+# ---------------------------------------------------------------------------
+# HELPER: ADD AN ITEM TO THE INVENTORY
+# ---------------------------------------------------------------------------
+# The inventory is kept twice: a list remembers the order in which items
+# were found (for display), and a set answers "do I already have this?".
+#
+# KEY CONCEPT: Checking `item in some_list` looks at every element one by
+# one, while `item in some_set` jumps straight to the answer using a hash,
+# so it stays fast no matter how many items the player collects.
+
+def add_to_inventory(player_info_arg, item):
+    """Adds item to the player's inventory unless it is already there.
+
+    Returns:
+        True if the item was newly added, False if the player already had it.
+    """
+    # Dictionaries made without "inventory_set" get one built from the list
+    # the first time, so older player_info dictionaries keep working.  The
+    # set is only built when it is missing; building it on every call would
+    # scan the whole list again and undo the point of having a set.
+    inventory_set = player_info_arg.get("inventory_set")
+    if inventory_set is None:
+        inventory_set = set(player_info_arg["inventory"])
+        player_info_arg["inventory_set"] = inventory_set
+
+    if item in inventory_set:
+        return False
+    player_info_arg["inventory"].append(item)
+    inventory_set.add(item)
+    return True
+
+
 # ===========================================================================
 # ACTION FUNCTIONS
 # ===========================================================================
@@ -135,6 +191,75 @@ def next_level(player_info_arg):
     return player_info_arg
 
 
+# ---------------------------------------------------------------------------
+# ROCK, PAPER, SCISSORS ENCODING
+# ---------------------------------------------------------------------------
+# Each move is stored as an integer so that the winner can be worked out
+# with arithmetic instead of string comparisons.  The moves are arranged so
+# that every move beats the one just before it (wrapping around):
+#     Rock (0) < Paper (1) < Scissors (2) < Rock (0) ...
+#
+# KEY CONCEPT: The modulo operator (%) "wraps" numbers into a fixed range.
+# For two moves u and c, (u - c) % 3 is always 0, 1 or 2:
+#     0 -> same move (tie)
+#     1 -> u is one step ahead of c (u wins)
+#     2 -> u is one step behind c (u loses)
+
+_NAMES = ("Rock", "Paper", "Scissors")
+_IDX = {name: index for index, name in enumerate(_NAMES)}
+
+# Precomputed move tables, indexed by a move:
+#     _BEATS[m]    -> the move that m beats          (one step behind m)
+#     _LOSES_TO[m] -> the move that beats m          (one step ahead of m)
+_BEATS = tuple((move - 1) % 3 for move in range(3))
+_LOSES_TO = tuple((move + 1) % 3 for move in range(3))
+
+# Inputs that end the mini-game.  A frozenset is an unchangeable set, which
+# makes membership checks a single hash lookup.
+EXIT_OPTIONS = frozenset({"No thanks", "Done"})
+
+# Indexed by (user - computer) % 3: (result, display message).
+_OUTCOMES = (
+    ("tie", "It's a tie!"),
+    ("win", "You win!"),
+    ("lose", "You lose!"),
+)
+
+
+# ---------------------------------------------------------------------------
+# VALIDATED RPS WEIGHTS
+# ---------------------------------------------------------------------------
+# Checking a weights list (three numbers that add up to 1.0) takes several
+# steps.  When the same weights are used round after round, we check them
+# once and wrap them in _ValidatedWeights, so rps() can recognise them and
+# skip the checks.
+#
+# KEY CONCEPT: A class can inherit from a built-in type.  _ValidatedWeights
+# behaves exactly like a tuple, but isinstance() can tell it apart.
+
+class _ValidatedWeights(tuple):
+    """A tuple of RPS weights that has already passed _validate_weights()."""
+    __slots__ = ()
+
+
+def _weights_are_valid(weights):
+    """Returns True if weights holds three numbers that sum to ~1.0."""
+    return (len(weights) == 3
+            and all(isinstance(w, (int, float)) for w in weights)
+            and math.isclose(sum(weights), 1.0))
+
+
+def _validate_weights(weights):
+    """Checks weights once and returns them as a _ValidatedWeights tuple.
+
+    Raises:
+        ValueError: If weights is not three numbers summing to ~1.0.
+    """
+    if not _weights_are_valid(weights):
+        raise ValueError(f"Invalid Rock, Paper, Scissors weights: {weights!r}")
+    return _ValidatedWeights(weights)
+
+
 def rps(user_wins=True):
     """Plays one round of Rock, Paper, Scissors.
 
@@ -143,6 +268,7 @@ def rps(user_wins=True):
             True  -> computer always loses (good for testing)
             False -> computer always wins
             list of 3 floats summing to ~1.0 -> weighted random choice
+            result of _validate_weights() -> weighted, without re-checking
 
     Returns:
         A tuple of three strings: (label, user_choice, result)
@@ -165,23 +291,15 @@ def rps(user_wins=True):
         be fragile and error-prone.
     """
 
-    # --- Constants ---
-    CHOICES = ["Rock", "Paper", "Scissors"]
-
-    # Each key beats its value: Rock beats Scissors, Paper beats Rock, etc.
-    WIN_SCENARIOS = {
-        "Rock": "Scissors",
-        "Paper": "Rock",
-        "Scissors": "Paper"
-    }
-
-    EXIT_OPTIONS = ["No thanks", "Done"]
-
     # --- Get user input ---
     print("Let's play Rock, Paper, Scissors!")
     prompt = ("Choose rock, paper, or scissors by entering the word "
               "(or type 'no thanks' or 'done' to exit): ")
-    user_input = input(prompt).strip().capitalize()
+    user_input = input(prompt).strip()
+    # Only build a capitalized copy when the input is not already one of
+    # the exact spellings we accept (e.g. "Rock" needs no change).
+    if user_input not in _IDX and user_input not in EXIT_OPTIONS:
+        user_input = user_input.capitalize()
 
     # --- Handle exit ---
     if user_input in EXIT_OPTIONS:
@@ -189,41 +307,30 @@ def rps(user_wins=True):
         return ("You chose not to play", user_input, "exit")
 
     # --- Validate ---
-    if user_input not in CHOICES:
+    if user_input not in _IDX:
         print("Invalid choice. Please enter Rock, Paper, or Scissors.")
         return ("Invalid choice", user_input, "invalid")
 
+    user_move = _IDX[user_input]
+
     # --- Determine computer choice ---
-    if (isinstance(user_wins, list)
-            and len(user_wins) == 3
-            and all(isinstance(w, (int, float)) for w in user_wins)
-            and math.isclose(sum(user_wins), 1.0)):
+    if (isinstance(user_wins, _ValidatedWeights)
+            or (isinstance(user_wins, list)
+                and _weights_are_valid(user_wins))):
         # Weighted random selection using the provided probabilities.
         # random.choices() returns a list; [0] gets the single element.
-        computer_choice = random.choices(CHOICES, weights=user_wins, k=1)[0]
+        computer_move = random.choices((0, 1, 2), weights=user_wins, k=1)[0]
     elif user_wins:
         # Deterministic: computer picks the choice that LOSES to the user.
-        computer_choice = WIN_SCENARIOS[user_input]
+        computer_move = _BEATS[user_move]
     else:
         # Deterministic: computer picks the choice that BEATS the user.
-        # We search WIN_SCENARIOS for the key whose value equals user_input.
-        computer_choice = next(
-            choice for choice, beats in WIN_SCENARIOS.items()
-            if beats == user_input
-        )
+        computer_move = _LOSES_TO[user_move]
 
     # --- Determine result ---
-    if WIN_SCENARIOS[user_input] == computer_choice:
-        result = "win"
-        display = "You win!"
-    elif WIN_SCENARIOS[computer_choice] == user_input:
-        result = "lose"
-        display = "You lose!"
-    else:
-        result = "tie"
-        display = "It's a tie!"
+    result, display = _OUTCOMES[(user_move - computer_move) % 3]
 
-    print(f"{computer_choice}. {display}")
+    print(f"{_NAMES[computer_move]}. {display}")
     return ("You typed", user_input, result)
 
 
@@ -231,6 +338,17 @@ def rps(user_wins=True):
 # CHARACTER FUNCTIONS
 # ===========================================================================
 
+# The guard puzzle as a lookup table: (guard_moved, action) -> outcome.
+# KEY CONCEPT: Tuples can be dictionary keys, so a pair of values can
+# select an entry directly instead of testing each combination in turn.
+_GUARD_OUTCOMES = {
+    (False, "run"): "distract",
+    (True, "run"): "die",
+    (True, "door"): "escape",
+    (False, "door"): "die",
+}
+
+
 def guard():
     """Handles the guard encounter in the Blue Room.
 
@@ -254,19 +372,19 @@ def guard():
     while True:
         next_action = input("[run | door] > ").lower()
 
-        if next_action == "run" and guard_moved:
-            you_died("The guard was faster than he looks and your world goes dark...")
+        # One dictionary lookup finds the outcome for this state and action.
+        outcome = _GUARD_OUTCOMES.get((guard_moved, next_action), "unknown")
 
-        elif next_action == "run" and not guard_moved:
+        if outcome == "distract":
             print("Guard jumps up and looks the other way, missing you entirely.")
             guard_moved = True  # The guard is now distracted
 
-        elif next_action == "door" and guard_moved:
+        elif outcome == "escape":
             print("You just slipped through the door before the guard realised it.")
             print("You are now outside, home free! Congratulations!")
             return  # Success — control returns to the calling room function
 
-        elif next_action == "door" and not guard_moved:
+        elif outcome == "die":
             you_died("The guard was faster than he looks and your world goes dark...")
 
         else:
@@ -295,8 +413,7 @@ def blissful_ignorance_of_illusion_room(player_info_arg):
 
     # Only add the item if the player does not already have it.
     # This prevents duplicates if the player re-enters the room.
-    if illusion not in player_info_arg["inventory"]:
-        player_info_arg["inventory"].append(illusion)
+    if add_to_inventory(player_info_arg, illusion):
         print(f"The blissful ignorance restores {healing} health "
               f"and grants you the {illusion}.")
 
@@ -368,8 +485,7 @@ def painful_truth_of_reality_room(player_info_arg):
     damage = 20
     knowledge = "Truth Scroll"
     player_info_arg["health"] -= damage
-    if knowledge not in player_info_arg["inventory"]:
-        player_info_arg["inventory"].append(knowledge)
+    if add_to_inventory(player_info_arg, knowledge):
         print(f"The painful truth costs you {damage} health "
               f"but grants you the {knowledge}.")
 
@@ -393,6 +509,11 @@ def painful_truth_of_reality_room(player_info_arg):
         you_died("You died. Well, that was tasty!")
 
 
+# Weighted probabilities for the magician: [Rock=0.3, Paper=0.4, Scissors=0.3]
+# Validated once here rather than on every round of the tie-retry loop.
+_GREEN_WEIGHTS = _validate_weights((0.3, 0.4, 0.3))
+
+
 def green_magic_room(player_info_arg):
     """The Green Room: play Rock, Paper, Scissors against a magician.
 
@@ -410,8 +531,7 @@ def green_magic_room(player_info_arg):
     player_info_arg["location"] = "Green Room"
 
     special_item = "Emerald Amulet"
-    if special_item not in player_info_arg["inventory"]:
-        player_info_arg["inventory"].append(special_item)
+    if add_to_inventory(player_info_arg, special_item):
         print(f"You found a {special_item} and added it to your inventory!")
 
     player_info_arg["choices"].append("Green Room")
@@ -421,8 +541,7 @@ def green_magic_room(player_info_arg):
     # We initialize result to "tie" so the while-loop runs at least once.
     result = "tie"
     while result == "tie":
-        # Weighted probabilities: [Rock=0.3, Paper=0.4, Scissors=0.3]
-        _label, _choice, result = rps([0.3, 0.4, 0.3])
+        _label, _choice, result = rps(_GREEN_WEIGHTS)
 
         if result == "tie":
             print("You tied and can play Rock, Paper, Scissors again.\n")
@@ -440,34 +559,40 @@ def green_magic_room(player_info_arg):
         print("The magician waves his hand and you are whisked away...\n")
         return "flee"
 
+
 def purple_reflection_room(player_info_arg):
-    ""The Purple Room: a quiet room for reflection and healing."" 
+    """The Purple Room: a quiet room for reflection and healing."""
     print("\nYou have entered the Purple Room.")
     print("The air is calm. The walls glow softly.")
-    
-#Update player status 
-player_info_arg["location"] = "Purple Room" 
-healing =10 
-player_info_arg["health"] += healing
-print(f"You reflect on your journey and regain {healing} health.")
-player_info_arg["choices"].append("Purple Room")
-show_player_info(player_info_arg)
-choice = input("Do you (rest) or (leave)? >").lower()
-if choice == "rest":
-    print("You feel peaceful, but nothing else happens.")
-else:
-    print("You leave the Purple Room.")
 
-return player_info_arg 
+    # --- Update player state ---
+    player_info_arg["location"] = "Purple Room"
 
-    
+    healing = 10
+    player_info_arg["health"] += healing
+    print(f"You reflect on your journey and regain {healing} health.")
+
+    player_info_arg["choices"].append("Purple Room")
+    show_player_info(player_info_arg)
 
+    choice = input("Do you (rest) or (leave)? >").lower()
+    if choice == "rest":
+        print("You feel peaceful, but nothing else happens.")
+    else:
+        print("You leave the Purple Room.")
+
+    return player_info_arg
 
 
 # ===========================================================================
 # CONTROL FUNCTIONS
 # ===========================================================================
 
+# The nickname the game suggests, and its shouted form, worked out once.
+_ALT_NAME = "Rainbow Unicorn"
+_ALT_NAME_UPPER = _ALT_NAME.upper()
+
+
 def get_player_name(player_info_arg):
     """Prompts the player for their name and optionally assigns a nickname.
 
@@ -483,27 +608,38 @@ def get_player_name(player_info_arg):
     """
     player_info_arg["name"] = input("Enter your player name: ").strip()
 
-    alt_name = "Rainbow Unicorn"
-    answer = input(f"Your name is {alt_name.upper()}, is that correct? [Y|N] > ")
+    answer = input(f"Your name is {_ALT_NAME_UPPER}, is that correct? [Y|N] > ")
+    answer = answer.lower()
 
-    if answer.lower() in ["y", "yes"]:
-        player_info_arg["name"] = alt_name
-        print(f"You are fun, {player_info_arg['name'].upper()}! "
+    if answer in ["y", "yes"]:
+        player_info_arg["name"] = _ALT_NAME
+        print(f"You are fun, {_ALT_NAME_UPPER}! "
               f"Let's begin our adventure!")
 
-    elif answer.lower() in ["n", "no"]:
+    elif answer in ["n", "no"]:
         print(f"Ok, picky. {player_info_arg['name'].upper()} it is. "
               f"Let's get started on our adventure.")
 
     else:
         print(f"Trying to be funny? Well, you will now be called "
-              f"{alt_name.upper()} anyway.")
-        player_info_arg["name"] = alt_name
+              f"{_ALT_NAME_UPPER} anyway.")
+        player_info_arg["name"] = _ALT_NAME
         print_smiley_face()
 
     return player_info_arg
 
 
+# Maps each door colour to the room function behind it.
+# KEY CONCEPT: Functions are objects, so they can be stored in a dictionary
+# and called later — room(player_info_arg) runs whichever room was chosen.
+_DOORS = {
+    "red": painful_truth_of_reality_room,
+    "blue": blissful_ignorance_of_illusion_room,
+    "green": green_magic_room,
+    "purple": purple_reflection_room,
+}
+
+
 def start_new_adventure(player_info_arg):
     """Presents the three-door choice and routes to the selected room.
 
@@ -532,15 +668,12 @@ def start_new_adventure(player_info_arg):
         # We compare only the first few characters so that inputs like
         # "red door", "blue", or "green one" all work.
         door = door_picked.strip().lower()
+        room = next((room_function
+                     for colour, room_function in _DOORS.items()
+                     if door.startswith(colour)), None)
 
-        if door.startswith("red"):
-            room_result = painful_truth_of_reality_room(player_info_arg)
-        elif door.startswith("blue"):
-            room_result = blissful_ignorance_of_illusion_room(player_info_arg)
-        elif door.startswith("green"):
-            room_result = green_magic_room(player_info_arg)
-        elif door.startswith("purple"):
-            room_result=purple_reflection_room(player_info_arg)
+        if room is not None:
+            room_result = room(player_info_arg)
         else:
             print("Sorry, it's either 'red', 'blue','green' or 'purple' as the "
                   "answer. You're the weakest link, goodbye!")
@@ -555,6 +688,25 @@ def start_new_adventure(player_info_arg):
     return player_info_arg
 
 
+def _buffer_stdout():
+    """Lets console output collect in a buffer instead of writing each line.
+
+    By default a terminal's output is written out at every newline.  This
+    turns that off and sends printed text straight into the same 8 KB byte
+    buffer the ASCII art uses, so everything printed between two questions
+    reaches the terminal in one write.  Nothing is delayed for the player:
+    input() always flushes the buffer before showing its prompt.
+
+    Only used when the script is run directly; streams without
+    reconfigure() (e.g. in notebooks) are left alone.
+    """
+    reconfigure = getattr(sys.stdout, "reconfigure", None)
+    if reconfigure is None:
+        return
+    reconfigure(line_buffering=False, write_through=True)
+    atexit.register(sys.stdout.flush)
+
+
 def main(player_info_main):
     """Main entry point: greets the player, runs the adventure, says goodbye.
 
@@ -587,153 +739,275 @@ def main(player_info_main):
 # Each function below prints a decorative text image to the console.
 # These use raw strings (r"...") so that backslashes are treated literally
 # and we do not need to double-escape them.
+#
+# The images are written below as triple-quoted strings in _RAW_ART.  When
+# the module loads, each one is tidied into the _ART dictionary, with the
+# blank line that goes before and after every image already included.
+# Each print_* function then sends its whole image to the console in a
+# single write, instead of one print() call (and one write to the terminal)
+# per line.
+
+_RAW_ART = {
+    "monster": r"""
+                           |                     | 
+                        \     /               \     / 
+                       -= .'> =-             -= <'. =- 
+                          '.'.                 .'.' 
+                            '.'.             .'.' 
+                              '.'.----^----.'.' 
+                               /'==========='\ 
+                           .  /  .-.     .-.  \  . 
+                           :'.\ '.O.') ('.O.' /.':   
+                           '. |               | .'   
+                             '|      / \      |' 
+                              \     (o'o)     / 
+                              |\             /| 
+                              \('._________.')/ 
+                               '. \/|_|_|\/ .'                
+                                /'._______.'\  
+""",
+
+    "chest": r"""
+                      _.--. 
+                  _.-'_:-'|| 
+              _.-'_.-::::'|| 
+         _.-:'_.-::::::'  || 
+       .'`-.-:::::::'     || 
+      /.'`;|:::::::'      ||_ 
+     ||   ||::::::'     _.;._'-._ 
+     ||   ||:::::'  _.-!oo @.!-._'-. 
+     ('.  ||:::::.-!()oo @!()@.-'_.| 
+      '.'-;|:.-'.&$@.& ()$%-'o.'-U|| 
+        `>'-.!@%()@'@_%-'_.-o _.|'|| 
+         ||-._'-.@.-'_.-' _.-o  |'|| 
+         ||=[ '-._.-+U/.-'    o |'|| 
+         || '-.]=|| |'|      o  |'|| 
+         ||      || |'|        _| '; 
+         ||      || |'|    _.-'_.-' 
+         |'-._   || |'|_.-'_.-' 
+          '-._'-.|| |' `_.-' 
+              '-.||_/.-' 
+""",
+
+    "guard": r"""
+                                                  ___I___ 
+                                                 /=  |  #\ 
+                                                /.__-| __ \ 
+                                                |/ _\_/_ \| 
+                                                (( __ \__)) 
+                                             __ ((()))))()) __ 
+                                           ,'  |()))))(((()|# `. 
+                                          /    |^))()))))(^|   =\ 
+                                         /    /^v^(())()()v^;'  .\ 
+                                         |__.'^v^v^))))))^v^v`.__| 
+                                        /_ ' \______(()_____(   | 
+                                   _..-'   _//_____[xxx]_____\.-| 
+                                  /,_#\.=-' /v^v^v^v^v^v^v^v^| _| 
+                                  \)|)      v^v^v^v^v^v^v^v^v| _| 
+                                   ||       :v^v^v^v^v^v`.-' |#  \, 
+                                   ||       v^v^v^v`_/\__,--.|\_=_/ 
+                                   ><       :v^v____|  \_____|_ 
+                                ,  ||       v^      /  \       / 
+                               //\_||_)\    `/_..-._\   )_...__\ 
+                              ||   \/  #|     |_='_(     |  =_(_ 
+                              ||  _/\_  |    /     =\    /  '  =\ 
+                               \\\/ \/ )/    |=____#|    '=....#| 
+""",
+
+    "game_over": r"""
+   _____          __  __ ______    ______      ________ _____  
+  / ____|   /\   |  \/  |  ____|  / __ \ \    / /  ____|  __ \ 
+ | |  __   /  \  | \  / | |__    | |  | \ \  / /| |__  | |__) |
+ | | |_ | / /\ \ | |\/| |  __|   | |  | |\ \/ / |  __| |  _  / 
+ | |__| |/ ____ \| |  | | |____  | |__| | \  /  | |____| | \ \ 
+  \_____/_/    \_\_|  |_|______|  \____/   \/   |______|_|  \_\\
+""",
+
+    "smiley_face": r"""
+       *****       
+    **       **    
+  **  O   O   **   
+ **     \_/     **  
+ **              **  
+  **   \___/   **   
+    **       **    
+       *****       
+""",
+
+    "magician": r"""
+                                                  _____ 
+                                                 /     \ 
+                                                /       \ 
+                                               /_________\ 
+                                              |         | 
+                                              |  () ()  | 
+                                               \   ^   / 
+                                                \_____/ 
+                                                 ||||| 
+                                                 ||||| 
+                                             ____/  _  \____ 
+                                            /    |       |   \ 
+                                           /     |       |    \ 
+                                          |      |       |     | 
+                                           \_____|_______|_____/ 
+                                             /   _______   \ 
+                                            /               \ 
+                                           |    O     O     | 
+                                            \_______________/ 
+                                             |||         ||| 
+                                             |||         ||| 
+                                             |||         ||| 
+                                            (___)       (___) 
+""",
+
+    "new_dungeon": r"""
+   _____________________________________________________________________________
+ /|     -_-                                                           _-      |\ 
+/ |_-_- _                                                     -_- _-   -_-   -| \   
+  |                                  _-  _--                                     | 
+  |                                  ,                                           |
+  |      .-'  '-.        '(        .-'  '-.       '(        .-'  '-.            |
+  |    . |        .      )'      . |        .    )'      . |        .          |
+  |   /   |   ()    \      U      /   |   ()    \      U      /   |   ()    \   |
+  |  |    |    ;     | o   T   o |    |    ;     | o   T   o |    |    ;     |  |
+  |  |    |     ;    |  .  |  .  |    |     ;    |  .  |  .  |    |     ;    |  |
+  |  |    |     ;    |   . | .   |    |     ;    |   . | .   |    |     ;    |  |
+  |  |    |     ;    |    .|.    |    |     ;    |    .|.    |    |     ;    |  |
+  |  |    |____;_____|     |     |    |____;_____|     |     |    |____;_____|  |  
+  |  |   /  __ ;  -  |     !     |   /     '() _-|     !     |  /     '() _-  |  |
+  |  |  / __  ()     |  -      - |  /  __--    -|  -      -  | /  __--     -  |  |
+  |  | /        __-- |    _- _   | /        __--|    _- _   | /        __--_  |  |
+  |__|/________________|_________|/________________|_________|/________________|__|
+ /                                                        _ -                      \ 
+/   -_- _ -                  _- _---                             -_-  -_-         \ 
+""",
+}
+
+
+def _tidy_art(raw):
+    """Prepares an ASCII-art string for printing.
+
+    Removes trailing spaces from every line (they are invisible on screen,
+    so dropping them changes nothing the player sees but makes every image
+    smaller to write) and surrounds the image with one blank line on each
+    side, so no separate print() calls are needed for spacing.
+    """
+    lines = raw.strip("\n").splitlines()
+    return "\n" + "\n".join(line.rstrip() for line in lines) + "\n\n"
+
+
+# sys.intern() keeps one shared copy of each finished image.  If the module
+# is loaded again (importlib.reload(), or a notebook cell run twice), the
+# rebuilt strings are swapped for the copies already in memory.
+_ART = {name: sys.intern(_tidy_art(raw)) for name, raw in _RAW_ART.items()}
+
+# The art is plain ASCII and never changes, so we also encode each image to
+# bytes once.  Writing bytes straight to the stream's underlying binary
+# buffer skips the text layer, which would otherwise re-encode the image on
+# every call.
+_ART_B = {name: art.encode("ascii") for name, art in _ART.items()}
+
+
+def _write_art(art_bytes):
+    """Writes a pre-encoded image to standard output.
+
+    Falls back to writing text when sys.stdout has no binary buffer
+    (for example, in Jupyter or when output is captured in a StringIO).
+    """
+    stream = sys.stdout
+    buffer = getattr(stream, "buffer", None)
+    if buffer is None:
+        stream.write(art_bytes.decode("ascii"))
+        return
+
+    # Anything already printed may still be waiting in the text layer;
+    # flush it first so the image appears after it, not before.  (With
+    # write_through on, printed text is already in the buffer.)  The image
+    # is left in the buffer to go out with the next flush, which print()
+    # or input() triggers.
+    if not getattr(stream, "write_through", False):
+        stream.flush()
+    buffer.write(art_bytes)
+
+
+def _art_enabled():
+    """Decides, once at start-up, whether the ASCII art should be shown.
+
+    The art is decoration for a person watching the screen.  When output is
+    piped to a file or another program (as in automated tests), or Python
+    runs with -O, it is skipped.  Notebooks such as Jupyter or Colab count
+    as watched even though their output is not a terminal.  Setting the
+    environment variable FORCE_ART=1 always shows the art.
+    """
+    if os.environ.get("FORCE_ART") == "1":
+        return True
+    if sys.flags.optimize:
+        return False
+    if "ipykernel" in sys.modules:
+        return True
+    isatty = getattr(sys.stdout, "isatty", None)
+    return bool(isatty and isatty())
+
+
+_ART_ENABLED = _art_enabled()
+
+
+def _show(name, write=None):
+    """Prints the ASCII-art image stored under `name` in _ART.
+
+    Args:
+        name: The key of the image in _ART.
+        write: Optional function that receives the image as a string,
+            such as a file's or StringIO's .write method.  By default
+            the image goes to standard output.
+
+    When the art is turned off (see _art_enabled()), nothing is printed to
+    standard output, but a write= function still receives the image.
+    """
+    if write is not None:
+        write(_ART[name])
+    elif _ART_ENABLED:
+        _write_art(_ART_B[name])
+
+
+# Each print_* name is _show() with its image name already filled in, so
+# callers keep writing print_monster() while all seven share one function.
+# KEY CONCEPT: functools.partial(f, x) makes a new callable that behaves
+# like f with x as its first argument.
+print_monster = partial(_show, "monster")
+print_chest = partial(_show, "chest")
+print_guard = partial(_show, "guard")
+print_game_over = partial(_show, "game_over")
+print_smiley_face = partial(_show, "smiley_face")
+print_magician = partial(_show, "magician")
+print_new_dungeon = partial(_show, "new_dungeon")
+
+
+def emit_many(funcs, out=None):
+    """Runs several art functions and writes their output in one go.
+
+    Each function is called with write= pointing at an in-memory buffer,
+    so the images are collected first and then written with a single call.
+
+    Args:
+        funcs: Art functions such as print_new_dungeon or print_guard.
+        out: Optional text stream to write to; defaults to sys.stdout.
+            With the default, nothing is written when the art is turned
+            off (see _art_enabled()).
+
+    Example:
+        emit_many([print_new_dungeon, print_guard])
+    """
+    if out is None and not _ART_ENABLED:
+        return
+
+    buffer = io.StringIO()
+    for func in funcs:
+        func(write=buffer.write)
 
-def print_monster():
-    print()
-    print(r"                           |                     | ")
-    print(r"                        \     /               \     / ")
-    print(r"                       -= .'> =-             -= <'. =- ")
-    print(r"                          '.'.                 .'.' ")
-    print(r"                            '.'.             .'.' ")
-    print(r"                              '.'.----^----.'.' ")
-    print(r"                               /'==========='\ ")
-    print(r"                           .  /  .-.     .-.  \  . ")
-    print(r"                           :'.\ '.O.') ('.O.' /.':   ")
-    print(r"                           '. |               | .'   ")
-    print(r"                             '|      / \      |' ")
-    print(r"                              \     (o'o)     / ")
-    print(r"                              |\             /| ")
-    print(r"                              \('._________.')/ ")
-    print(r"                               '. \/|_|_|\/ .'                ")
-    print(r"                                /'._______.'\  ")
-    print()
-
-
-def print_chest():
-    print()
-    print(r"                      _.--. ")
-    print(r"                  _.-'_:-'|| ")
-    print(r"              _.-'_.-::::'|| ")
-    print(r"         _.-:'_.-::::::'  || ")
-    print(r"       .'`-.-:::::::'     || ")
-    print(r"      /.'`;|:::::::'      ||_ ")
-    print(r"     ||   ||::::::'     _.;._'-._ ")
-    print(r"     ||   ||:::::'  _.-!oo @.!-._'-. ")
-    print(r"     ('.  ||:::::.-!()oo @!()@.-'_.| ")
-    print(r"      '.'-;|:.-'.&$@.& ()$%-'o.'-U|| ")
-    print(r"        `>'-.!@%()@'@_%-'_.-o _.|'|| ")
-    print(r"         ||-._'-.@.-'_.-' _.-o  |'|| ")
-    print(r"         ||=[ '-._.-+U/.-'    o |'|| ")
-    print(r"         || '-.]=|| |'|      o  |'|| ")
-    print(r"         ||      || |'|        _| '; ")
-    print(r"         ||      || |'|    _.-'_.-' ")
-    print(r"         |'-._   || |'|_.-'_.-' ")
-    print(r"          '-._'-.|| |' `_.-' ")
-    print(r"              '-.||_/.-' ")
-    print()
-
-
-def print_guard():
-    print()
-    print(r"                                                  ___I___ ")
-    print(r"                                                 /=  |  #\ ")
-    print(r"                                                /.__-| __ \ ")
-    print(r"                                                |/ _\_/_ \| ")
-    print(r"                                                (( __ \__)) ")
-    print(r"                                             __ ((()))))()) __ ")
-    print(r"                                           ,'  |()))))(((()|# `. ")
-    print(r"                                          /    |^))()))))(^|   =\ ")
-    print(r"                                         /    /^v^(())()()v^;'  .\ ")
-    print(r"                                         |__.'^v^v^))))))^v^v`.__| ")
-    print(r"                                        /_ ' \______(()_____(   | ")
-    print(r"                                   _..-'   _//_____[xxx]_____\.-| ")
-    print(r"                                  /,_#\.=-' /v^v^v^v^v^v^v^v^| _| ")
-    print(r"                                  \)|)      v^v^v^v^v^v^v^v^v| _| ")
-    print(r"                                   ||       :v^v^v^v^v^v`.-' |#  \, ")
-    print(r"                                   ||       v^v^v^v`_/\__,--.|\_=_/ ")
-    print(r"                                   ><       :v^v____|  \_____|_ ")
-    print(r"                                ,  ||       v^      /  \       / ")
-    print(r"                               //\_||_)\    `/_..-._\   )_...__\ ")
-    print(r"                              ||   \/  #|     |_='_(     |  =_(_ ")
-    print(r"                              ||  _/\_  |    /     =\    /  '  =\ ")
-    print(r"                               \\\/ \/ )/    |=____#|    '=....#| ")
-    print()
-
-
-def print_game_over():
-    print()
-    print(r"   _____          __  __ ______    ______      ________ _____  ")
-    print(r"  / ____|   /\   |  \/  |  ____|  / __ \ \    / /  ____|  __ \ ")
-    print(r" | |  __   /  \  | \  / | |__    | |  | \ \  / /| |__  | |__) |")
-    print(r" | | |_ | / /\ \ | |\/| |  __|   | |  | |\ \/ / |  __| |  _  / ")
-    print(r" | |__| |/ ____ \| |  | | |____  | |__| | \  /  | |____| | \ \ ")
-    print(r"  \_____/_/    \_\_|  |_|______|  \____/   \/   |______|_|  \_\\")
-    print()
-
-
-def print_smiley_face():
-    print()
-    print(r"       *****       ")
-    print(r"    **       **    ")
-    print(r"  **  O   O   **   ")
-    print(r" **     \_/     **  ")
-    print(r" **              **  ")
-    print(r"  **   \___/   **   ")
-    print(r"    **       **    ")
-    print(r"       *****       ")
-    print()
-
-
-def print_magician():
-    print()
-    print(r"                                                  _____ ")
-    print(r"                                                 /     \ ")
-    print(r"                                                /       \ ")
-    print(r"                                               /_________\ ")
-    print(r"                                              |         | ")
-    print(r"                                              |  () ()  | ")
-    print(r"                                               \   ^   / ")
-    print(r"                                                \_____/ ")
-    print(r"                                                 ||||| ")
-    print(r"                                                 ||||| ")
-    print(r"                                             ____/  _  \____ ")
-    print(r"                                            /    |       |   \ ")
-    print(r"                                           /     |       |    \ ")
-    print(r"                                          |      |       |     | ")
-    print(r"                                           \_____|_______|_____/ ")
-    print(r"                                             /   _______   \ ")
-    print(r"                                            /               \ ")
-    print(r"                                           |    O     O     | ")
-    print(r"                                            \_______________/ ")
-    print(r"                                             |||         ||| ")
-    print(r"                                             |||         ||| ")
-    print(r"                                             |||         ||| ")
-    print(r"                                            (___)       (___) ")
-    print()
-
-
-def print_new_dungeon():
-    print()
-    print(r"   _____________________________________________________________________________")
-    print(r" /|     -_-                                                           _-      |\ ")
-    print(r"/ |_-_- _                                                     -_- _-   -_-   -| \   ")
-    print(r"  |                                  _-  _--                                     | ")
-    print(r"  |                                  ,                                           |")
-    print(r"  |      .-'  '-.        '(        .-'  '-.       '(        .-'  '-.            |")
-    print(r"  |    . |        .      )'      . |        .    )'      . |        .          |")
-    print(r"  |   /   |   ()    \      U      /   |   ()    \      U      /   |   ()    \   |")
-    print(r"  |  |    |    ;     | o   T   o |    |    ;     | o   T   o |    |    ;     |  |")
-    print(r"  |  |    |     ;    |  .  |  .  |    |     ;    |  .  |  .  |    |     ;    |  |")
-    print(r"  |  |    |     ;    |   . | .   |    |     ;    |   . | .   |    |     ;    |  |")
-    print(r"  |  |    |     ;    |    .|.    |    |     ;    |    .|.    |    |     ;    |  |")
-    print(r"  |  |    |____;_____|     |     |    |____;_____|     |     |    |____;_____|  |  ")
-    print(r"  |  |   /  __ ;  -  |     !     |   /     '() _-|     !     |  /     '() _-  |  |")
-    print(r"  |  |  / __  ()     |  -      - |  /  __--    -|  -      -  | /  __--     -  |  |")
-    print(r"  |  | /        __-- |    _- _   | /        __--|    _- _   | /        __--_  |  |")
-    print(r"  |__|/________________|_________|/________________|_________|/________________|__|")
-    print(r" /                                                        _ -                      \ ")
-    print(r"/   -_- _ -                  _- _---                             -_-  -_-         \ ")
-    print()
+    if out is None:
+        out = sys.stdout
+    out.write(buffer.getvalue())
 
 
 # ===========================================================================
@@ -745,4 +1019,5 @@ def print_new_dungeon():
 # they can call main(player_info) themselves when ready.
 
 if __name__ == '__main__':
+    _buffer_stdout()
     player_info = main(player_info)
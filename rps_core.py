@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+CodingGrace: Rock-Paper-Scissors Simulation Core
+=================================================
+A numeric version of the Rock, Paper, Scissors round played by rps() in
+coding_grace_game.py, for running many rounds at once (for example, to
+check how often a player wins against the magician's weighted strategy).
+
+The interactive rps() is unchanged; this module only repeats its maths.
+
+Moves use the same integer encoding as the game:
+    Rock = 0, Paper = 1, Scissors = 2
+and a round's outcome is d = (user - computer) % 3:
+    0 -> tie, 1 -> user wins, 2 -> user loses
+
+Optional dependency
+-------------------
+If Numba is installed, the functions below are compiled to machine code
+the first time they are called (and cached on disk for later runs).
+Without Numba they run as ordinary Python, giving the same results, only
+more slowly.
+"""
+
+# ---------------------------------------------------------------------------
+# IMPORTS
+# ---------------------------------------------------------------------------
+# `random` works both in plain Python and inside Numba-compiled functions,
+# so we use random.random() rather than random.choices() here.
+import random
+
+# Numba is optional.  If it is missing we define stand-ins with the same
+# names: njit() returns the function unchanged and prange is plain range.
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function uncompiled."""
+        # Supports both the bare @njit form and the @njit(...) form.
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda function: function
+
+    prange = range
+
+
+# ---------------------------------------------------------------------------
+# STRATEGY MODES
+# ---------------------------------------------------------------------------
+# These mirror the three kinds of `user_wins` argument accepted by rps().
+
+MODE_WEIGHTED = 0     # computer picks at random using the given weights
+MODE_USER_WINS = 1    # computer always picks the move the user beats
+MODE_USER_LOSES = 2   # computer always picks the move that beats the user
+
+
+@njit(cache=True)
+def rps_core(u, weights3, mode):
+    """Plays one numeric round of Rock, Paper, Scissors.
+
+    Args:
+        u: The user's move (0, 1 or 2).
+        weights3: A tuple of three floats giving the computer's chance of
+            picking Rock, Paper and Scissors.  Only used in MODE_WEIGHTED.
+        mode: One of MODE_WEIGHTED, MODE_USER_WINS or MODE_USER_LOSES.
+
+    Returns:
+        A tuple (c, d): the computer's move and the outcome code
+        d = (u - c) % 3.
+    """
+    if mode == MODE_USER_WINS:
+        c = (u - 1) % 3
+    elif mode == MODE_USER_LOSES:
+        c = (u + 1) % 3
+    else:
+        # Weighted choice: pick a point along the total weight and see
+        # which move's slice of the line it lands in.
+        r = random.random() * (weights3[0] + weights3[1] + weights3[2])
+        if r < weights3[0]:
+            c = 0
+        elif r < weights3[0] + weights3[1]:
+            c = 1
+        else:
+            c = 2
+
+    return c, (u - c) % 3
+
+
+@njit(parallel=True, cache=True)
+def _rps_batch_kernel(n, weights3, user_move):
+    """Plays n weighted rounds and counts (ties, wins, losses)."""
+    ties = 0
+    wins = 0
+    losses = 0
+    # prange lets Numba split the rounds across CPU cores; the three
+    # counters are combined automatically at the end.
+    for _ in prange(n):
+        _c, d = rps_core(user_move, weights3, MODE_WEIGHTED)
+        if d == 0:
+            ties += 1
+        elif d == 1:
+            wins += 1
+        else:
+            losses += 1
+    return ties, wins, losses
+
+
+def rps_batch(n, weights, user_move=0):
+    """Simulates n rounds of Rock, Paper, Scissors against weighted odds.
+
+    Args:
+        n: Number of rounds to play.
+        weights: Three numbers giving the computer's chance of picking
+            Rock, Paper and Scissors, e.g. [0.3, 0.4, 0.3].
+        user_move: The move the user plays every round (0, 1 or 2).
+
+    Returns:
+        A tuple (ties, wins, losses) counting the outcomes.
+
+    Raises:
+        ValueError: If user_move is not 0, 1 or 2, or the weights are not
+            three non-negative numbers with a positive total.
+
+    Note:
+        With Numba installed, the first call includes compilation time.
+    """
+    # The compiled kernel does no checking of its own (bad input would give
+    # silently wrong counts), so everything is validated here first.
+    if len(weights) != 3:
+        raise ValueError("weights must contain exactly three values")
+
+    # Numba compiles for a fixed tuple of floats, so convert whatever
+    # sequence the caller passed (a list, ints, etc.) into that shape.
+    weights3 = (float(weights[0]), float(weights[1]), float(weights[2]))
+    if any(w < 0 for w in weights3):
+        raise ValueError("weights must not be negative")
+    if not sum(weights3) > 0:
+        raise ValueError("weights must have a positive total")
+
+    user_move = int(user_move)
+    if user_move not in (0, 1, 2):
+        raise ValueError("user_move must be 0 (Rock), 1 (Paper) "
+                         "or 2 (Scissors)")
+
+    return _rps_batch_kernel(int(n), weights3, user_move)